@@ -3,9 +3,9 @@ use crate::file_manager::FileManager;
 use anyhow::{Result, Context};
 use std::path::Path;
 use std::fs;
-use zip::ZipWriter;
+use zip::{CompressionMethod, ZipWriter};
 use zip::write::FileOptions;
-use std::io::{Read, Write};
+use std::io::{self, Write};
 
 #[derive(Clone)]
 pub struct ExportImportManager {
@@ -24,55 +24,61 @@ impl ExportImportManager {
         let mut zip = ZipWriter::new(file);
 
         let evidence_dir = self.file_manager.get_evidence_dir();
-        
-        // Count total files for progress tracking
-        let mut total_files = 0;
-        let mut processed_files = 0;
-        
-        // First pass: count total files for selected persons only
+
+        // Single pass over the evidence tree: collect the files to archive
+        // for selected persons, and the progress total falls out of the
+        // list length
+        let mut files = Vec::new();
         for person in persons {
-            let person_dir = evidence_dir.join(person.folder_name());
+            let person_dir = self.file_manager.person_dir(person);
             if person_dir.exists() {
                 for entry in walkdir::WalkDir::new(&person_dir) {
                     let entry = entry.context("Failed to read directory entry")?;
-                    if entry.file_type().is_file() {
-                        total_files += 1;
+                    if entry.file_type().is_file() && !is_junk_file(entry.file_name()) {
+                        files.push(entry.into_path());
                     }
                 }
             }
         }
-        
-        // Second pass: add files for selected persons only
-        for person in persons {
-            let person_dir = evidence_dir.join(person.folder_name());
-            if person_dir.exists() {
-                for entry in walkdir::WalkDir::new(&person_dir) {
-                    let entry = entry.context("Failed to read directory entry")?;
-                    let path = entry.path();
-                    
-                    if entry.file_type().is_file() {
-                        let relative_path = path.strip_prefix(evidence_dir)
-                            .context("Failed to strip evidence directory prefix")?;
-                        
-                        let zip_path = relative_path.to_string_lossy().replace('\\', "/");
-                        
-                        zip.start_file(&zip_path, FileOptions::default())
-                            .context("Failed to start file in zip")?;
-                        
-                        let file_content = fs::read(path)
-                            .context("Failed to read file")?;
-                        
-                        zip.write_all(&file_content)
-                            .context("Failed to write file to zip")?;
-                        
-                        processed_files += 1;
-                        
-                        if let Some(ref callback) = progress_callback {
-                            let progress = (processed_files as f32 / total_files as f32 * 100.0) as u32;
-                            callback(format!("Exporting... {}%", progress));
-                        }
-                    }
-                }
+
+        let total_files = files.len();
+
+        for (index, path) in files.iter().enumerate() {
+            let relative_path = path.strip_prefix(evidence_dir)
+                .context("Failed to strip evidence directory prefix")?;
+
+            // The backslash rewrite only matters for Windows paths; keep the
+            // borrowed form when there is nothing to replace
+            let zip_path = relative_path.to_string_lossy();
+            let zip_path = if zip_path.contains('\\') {
+                std::borrow::Cow::Owned(zip_path.replace('\\', "/"))
+            } else {
+                zip_path
+            };
+
+            let compression = compression_for(path);
+            let mut options = FileOptions::default()
+                .compression_method(compression)
+                .large_file(true);
+
+            // The few entries still worth deflating are small JSON/text, so
+            // spend the maximum level on them
+            if compression == CompressionMethod::Deflated {
+                options = options.compression_level(Some(9));
+            }
+
+            zip.start_file(zip_path.as_ref(), options)
+                .context("Failed to start file in zip")?;
+
+            let file_content = fs::read(path)
+                .context("Failed to read file")?;
+
+            zip.write_all(&file_content)
+                .context("Failed to write file to zip")?;
+
+            if let Some(ref callback) = progress_callback {
+                let progress = ((index + 1) as f32 / total_files as f32 * 100.0) as u32;
+                callback(format!("Exporting... {}%", progress));
             }
         }
 
@@ -92,7 +98,8 @@ impl ExportImportManager {
         let mut persons = Vec::new();
         
         let total_files = zip.len();
-        
+        let mut last_parent: Option<std::path::PathBuf> = None;
+
         // Extract all files directly to the Evidence directory
         for i in 0..total_files {
             let mut file = zip.by_index(i)
@@ -108,18 +115,22 @@ impl ExportImportManager {
                 None => continue,
             };
             
-            // Ensure the target directory exists
+            // Ensure the target directory exists; entries arrive grouped by
+            // folder, so skip the mkdir when the parent hasn't changed
             if let Some(parent) = outpath.parent() {
-                fs::create_dir_all(parent)
-                    .context("Failed to create target directory")?;
+                if last_parent.as_deref() != Some(parent) {
+                    fs::create_dir_all(parent)
+                        .context("Failed to create target directory")?;
+                    last_parent = Some(parent.to_path_buf());
+                }
             }
             
-            // Extract the file
-            let mut file_content = Vec::new();
-            file.read_to_end(&mut file_content)
-                .context("Failed to read file from zip")?;
-            
-            fs::write(&outpath, file_content)
+            // Stream the entry straight to disk instead of buffering the
+            // whole file in memory first
+            let mut outfile = fs::File::create(&outpath)
+                .context("Failed to create extracted file")?;
+
+            io::copy(&mut file, &mut outfile)
                 .context("Failed to write extracted file")?;
         }
         
@@ -146,7 +157,7 @@ impl ExportImportManager {
     fn ensure_person_subdirectories(&self, person: &Person) -> Result<()> {
         use crate::models::EvidenceType;
         
-        let person_folder = self.file_manager.get_evidence_dir().join(person.folder_name());
+        let person_folder = self.file_manager.person_dir(person);
         
         // Create all required subdirectories
         for evidence_type in [EvidenceType::Image, EvidenceType::Audio, EvidenceType::Video, EvidenceType::Document, EvidenceType::Quote] {
@@ -159,3 +170,19 @@ impl ExportImportManager {
     }
 
 }
+
+/// Filesystem litter that has no business inside an archive
+fn is_junk_file(name: &std::ffi::OsStr) -> bool {
+    name == ".DS_Store" || name == "Thumbs.db"
+}
+
+/// Media files are already compressed, so DEFLATE only burns CPU on them;
+/// reserve it for the plain-text formats that actually shrink
+fn compression_for(path: &Path) -> CompressionMethod {
+    match path.extension().and_then(|e| e.to_str()) {
+        Some(ext) if ext.eq_ignore_ascii_case("json")
+            || ext.eq_ignore_ascii_case("txt")
+            || ext.eq_ignore_ascii_case("md") => CompressionMethod::Deflated,
+        _ => CompressionMethod::Stored,
+    }
+}
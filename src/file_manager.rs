@@ -33,14 +33,16 @@ impl FileManager {
         &self.evidence_dir
     }
 
+    pub fn person_dir(&self, person: &Person) -> PathBuf {
+        self.evidence_dir.join(person.folder_name())
+    }
+
     pub fn create_person_folder(&self, person: &Person) -> Result<PathBuf> {
-        let person_folder = self.evidence_dir.join(person.folder_name());
+        let person_folder = self.person_dir(person);
         
         if !person_folder.exists() {
-            fs::create_dir_all(&person_folder)
-                .context("Failed to create person folder")?;
-            
-            // Create subfolders for different media types
+            // Create subfolders for different media types; create_dir_all
+            // also creates the person folder itself as their parent
             for evidence_type in [EvidenceType::Image, EvidenceType::Audio, EvidenceType::Video, EvidenceType::Document, EvidenceType::Quote] {
                 let subfolder = person_folder.join(evidence_type.folder_name());
                 fs::create_dir_all(&subfolder)
@@ -54,27 +56,31 @@ impl FileManager {
     pub fn save_person_data(&self, person: &Person) -> Result<()> {
         let person_folder = self.create_person_folder(person)?;
         let person_data_file = person_folder.join("person_data.json");
-        
-        let json = serde_json::to_string_pretty(person)
+        let temp_file = person_folder.join("person_data.json.tmp");
+
+        let json = serde_json::to_vec_pretty(person)
             .context("Failed to serialize person data")?;
-        
-        fs::write(&person_data_file, json)
+
+        // Write to a temp file and rename so a crash mid-write can never
+        // leave a truncated person_data.json behind
+        fs::write(&temp_file, json)
             .context("Failed to write person data file")?;
 
+        fs::rename(&temp_file, &person_data_file)
+            .context("Failed to replace person data file")?;
+
         Ok(())
     }
 
     pub fn load_person_data(&self, person_folder: &Path) -> Result<Person> {
         let person_data_file = person_folder.join("person_data.json");
-        
-        if !person_data_file.exists() {
-            return Err(anyhow::anyhow!("Person data file not found"));
-        }
 
-        let json = fs::read_to_string(&person_data_file)
+        // No exists() pre-check: the read itself reports a missing file,
+        // saving a stat per person on the startup scan
+        let json = fs::read(&person_data_file)
             .context("Failed to read person data file")?;
-        
-        let person: Person = serde_json::from_str(&json)
+
+        let person: Person = serde_json::from_slice(&json)
             .context("Failed to parse person data")?;
 
         Ok(person)
@@ -87,10 +93,11 @@ impl FileManager {
             .context("Failed to read Evidence directory")?
         {
             let entry = entry.context("Failed to read directory entry")?;
-            let path = entry.path();
+            let file_type = entry.file_type()
+                .context("Failed to read directory entry type")?;
 
-            if path.is_dir() && path.file_name().and_then(|n| n.to_str()).map(|s| s != ".").unwrap_or(false) {
-                if let Ok(person) = self.load_person_data(&path) {
+            if file_type.is_dir() {
+                if let Ok(person) = self.load_person_data(&entry.path()) {
                     persons.push(person);
                 }
             }
@@ -100,20 +107,38 @@ impl FileManager {
     }
 
     pub fn delete_person(&self, person: &Person) -> Result<()> {
-        let person_folder = self.evidence_dir.join(person.folder_name());
-        
-        if person_folder.exists() {
-            fs::remove_dir_all(&person_folder)
-                .context("Failed to delete person folder")?;
+        let person_folder = self.person_dir(person);
+
+        // Resolve symlinks and any path tricks in the person name before
+        // deleting; never remove anything outside the Evidence directory
+        let resolved = match fs::canonicalize(&person_folder) {
+            Ok(path) => path,
+            // Already gone — deletion has nothing left to do
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(()),
+            Err(e) => return Err(e).context("Failed to resolve person folder"),
+        };
+        let evidence_root = fs::canonicalize(&self.evidence_dir)
+            .context("Failed to resolve Evidence directory")?;
+
+        // A person named "." resolves to the Evidence root itself; deleting
+        // the root would wipe every person, so only accept strict children
+        if resolved == evidence_root || !resolved.starts_with(&evidence_root) {
+            return Err(anyhow::anyhow!("Person folder is outside the Evidence directory"));
         }
 
+        fs::remove_dir_all(&resolved)
+            .context("Failed to delete person folder")?;
+
         Ok(())
     }
 
     pub fn copy_file_to_evidence(&self, person: &Person, source_path: &Path, evidence_type: EvidenceType) -> Result<EvidenceFile> {
-        let person_folder = self.create_person_folder(person)?;
-        let target_folder = person_folder.join(evidence_type.folder_name());
-        
+        // Only the target subfolder is needed here; create_dir_all also
+        // creates the person folder if this is the first file added
+        let target_folder = self.person_dir(person).join(evidence_type.folder_name());
+        fs::create_dir_all(&target_folder)
+            .context("Failed to create evidence subfolder")?;
+
         let file_name = source_path.file_name()
             .context("Source file has no name")?
             .to_string_lossy();
@@ -122,18 +147,20 @@ impl FileManager {
         
         // Handle duplicate file names
         let mut final_path = target_path.clone();
-        let mut counter = 1;
-        while final_path.exists() {
+        if final_path.exists() {
             let stem = source_path.file_stem()
                 .context("Source file has no stem")?
                 .to_string_lossy();
             let extension = source_path.extension()
                 .context("Source file has no extension")?
                 .to_string_lossy();
-            
-            let new_name = format!("{}_{}.{}", stem, counter, extension);
-            final_path = target_folder.join(new_name);
-            counter += 1;
+
+            let mut counter = 1;
+            while final_path.exists() {
+                let new_name = format!("{}_{}.{}", stem, counter, extension);
+                final_path = target_folder.join(new_name);
+                counter += 1;
+            }
         }
 
         fs::copy(source_path, &final_path)
@@ -155,7 +182,7 @@ impl FileManager {
     }
 
     pub fn scan_person_evidence(&self, person: &Person) -> Result<Vec<EvidenceFile>> {
-        let person_folder = self.evidence_dir.join(person.folder_name());
+        let person_folder = self.person_dir(person);
         let mut evidence_files = Vec::new();
 
         if !person_folder.exists() {
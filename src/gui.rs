@@ -1,4 +1,4 @@
-use crate::models::{Person, EvidenceFile, EvidenceType};
+use crate::models::{Person, EvidenceType};
 use crate::state::{AppState, Message};
 use iced::{
     widget::{
@@ -8,6 +8,12 @@ use iced::{
     Element, Length, Alignment, Color, theme,
 };
 
+// Palette shared across the views; hoisted so the literals are written once
+const ACCENT: Color = Color::from_rgb(0.2, 0.2, 0.8);
+const MUTED: Color = Color::from_rgb(0.5, 0.5, 0.5);
+const SUCCESS: Color = Color::from_rgb(0.0, 0.5, 0.0);
+const ERROR: Color = Color::from_rgb(0.8, 0.2, 0.2);
+
 #[derive(Debug, Clone, PartialEq)]
 pub enum EvidenceTab {
     Information,
@@ -19,16 +25,14 @@ pub enum EvidenceTab {
 }
 
 impl EvidenceTab {
-    fn all() -> Vec<EvidenceTab> {
-        vec![
-            EvidenceTab::Information,
-            EvidenceTab::Images,
-            EvidenceTab::Audio,
-            EvidenceTab::Videos,
-            EvidenceTab::Documents,
-            EvidenceTab::Quotes,
-        ]
-    }
+    const ALL: [EvidenceTab; 6] = [
+        EvidenceTab::Information,
+        EvidenceTab::Images,
+        EvidenceTab::Audio,
+        EvidenceTab::Videos,
+        EvidenceTab::Documents,
+        EvidenceTab::Quotes,
+    ];
     
     fn label(&self) -> &'static str {
         match self {
@@ -56,7 +60,7 @@ pub fn view(state: &AppState) -> Element<'_, Message> {
 
     // Add modal dialogs
     if state.show_add_person_dialog {
-        layout = layout.push(add_person_dialog(state).unwrap());
+        layout = layout.push(add_person_dialog(state));
     }
 
     // Add status bar at bottom
@@ -64,7 +68,7 @@ pub fn view(state: &AppState) -> Element<'_, Message> {
         layout = layout.push(
             container(
                 text(&state.status_message)
-                    .style(theme::Text::Color(Color::from_rgb(0.0, 0.5, 0.0)))
+                    .style(theme::Text::Color(SUCCESS))
             )
             .padding(5)
             .style(theme::Container::Box)
@@ -76,7 +80,7 @@ pub fn view(state: &AppState) -> Element<'_, Message> {
 
 fn sidebar(state: &AppState) -> Element<'_, Message> {
     let mut sidebar_content = column![
-        text("Evidence Manager").size(20).style(theme::Text::Color(Color::from_rgb(0.2, 0.2, 0.8))),
+        text("Evidence Manager").size(20).style(theme::Text::Color(ACCENT)),
         Space::with_height(10),
     ];
 
@@ -107,26 +111,32 @@ fn sidebar(state: &AppState) -> Element<'_, Message> {
 
     // Person list
     let person_list: Element<Message> = if state.filtered_persons.is_empty() {
-        text("No people found").style(theme::Text::Color(Color::from_rgb(0.5, 0.5, 0.5))).into()
+        text("No people found").style(theme::Text::Color(MUTED)).into()
     } else {
         let mut person_buttons = Column::new().spacing(2);
-        
-        for person_id in &state.filtered_persons {
-            if let Some(person) = state.persons.iter().find(|p| p.id == *person_id) {
-                let is_selected = state.selected_person == Some(person.id);
-                let button_style = if is_selected {
-                    theme::Button::Primary
-                } else {
-                    theme::Button::Secondary
-                };
-                
-                person_buttons = person_buttons.push(
-                    button(&*person.name)
-                        .on_press(Message::PersonSelected(person.id))
-                        .style(button_style)
-                        .width(Length::Fill)
-                );
+
+        // filtered_persons preserves the order of persons, so a single
+        // merge pass avoids a linear find per entry
+        let mut filtered = state.filtered_persons.iter().peekable();
+        for person in &state.persons {
+            if filtered.peek().copied() != Some(&person.id) {
+                continue;
             }
+            filtered.next();
+
+            let is_selected = state.selected_person == Some(person.id);
+            let button_style = if is_selected {
+                theme::Button::Primary
+            } else {
+                theme::Button::Secondary
+            };
+
+            person_buttons = person_buttons.push(
+                button(&*person.name)
+                    .on_press(Message::PersonSelected(person.id))
+                    .style(button_style)
+                    .width(Length::Fill)
+            );
         }
         
         scrollable(person_buttons)
@@ -152,7 +162,7 @@ fn main_content(state: &AppState) -> Element<'_, Message> {
                 row![
                     text(format!("Evidence for: {}", person.name))
                         .size(18)
-                        .style(theme::Text::Color(Color::from_rgb(0.2, 0.2, 0.8))),
+                        .style(theme::Text::Color(ACCENT)),
                     Space::with_width(Length::Fill),
                     button("Delete Person")
                         .on_press(Message::DeletePerson(person.id))
@@ -168,7 +178,7 @@ fn main_content(state: &AppState) -> Element<'_, Message> {
 
             // Tab navigation
             let mut tab_row = Row::new().spacing(5);
-            for tab in EvidenceTab::all() {
+            for tab in EvidenceTab::ALL {
                 let is_selected = state.current_tab == tab;
                 let button_style = if is_selected {
                     theme::Button::Primary
@@ -216,7 +226,7 @@ fn main_content(state: &AppState) -> Element<'_, Message> {
         } else {
             container(
                 text("Person not found")
-                    .style(theme::Text::Color(Color::from_rgb(0.8, 0.2, 0.2)))
+                    .style(theme::Text::Color(ERROR))
             )
             .width(Length::Fill)
             .height(Length::Fill)
@@ -228,10 +238,10 @@ fn main_content(state: &AppState) -> Element<'_, Message> {
             column![
                 text("Select a person to view evidence")
                     .size(16)
-                    .style(theme::Text::Color(Color::from_rgb(0.5, 0.5, 0.5))),
+                    .style(theme::Text::Color(MUTED)),
                 Space::with_height(10),
                 text("Use the 'Select File to Add' button in each tab to add evidence files")
-                    .style(theme::Text::Color(Color::from_rgb(0.5, 0.5, 0.5))),
+                    .style(theme::Text::Color(MUTED)),
             ]
             .align_items(Alignment::Center)
         )
@@ -268,18 +278,17 @@ fn information_tab<'a>(state: &'a AppState, person: &'a Person) -> Element<'a, M
     if person.information.is_empty() {
         content = content.push(
             text("No information added yet")
-                .style(theme::Text::Color(Color::from_rgb(0.5, 0.5, 0.5)))
+                .style(theme::Text::Color(MUTED))
         );
     } else {
         content = content.push(
             text("Information")
                 .size(14)
-                .style(theme::Text::Color(Color::from_rgb(0.2, 0.2, 0.8)))
+                .style(theme::Text::Color(ACCENT))
         );
 
-        let mut info_list = Column::new().spacing(2);
-        for info in &person.information {
-            info_list = info_list.push(
+        let info_list = Column::with_children(
+            person.information.iter().map(|info| {
                 row![
                     text(&info.info_type)
                         .width(Length::FillPortion(1)),
@@ -291,9 +300,12 @@ fn information_tab<'a>(state: &'a AppState, person: &'a Person) -> Element<'a, M
                 ]
                 .spacing(5)
                 .align_items(Alignment::Center)
-            );
-        }
-        
+                .into()
+            })
+        )
+        .spacing(2);
+
+
         content = content.push(
             scrollable(info_list)
                 .height(Length::Fixed(300.0))
@@ -324,40 +336,42 @@ fn media_tab(state: &AppState, media_type: EvidenceType) -> Element<'_, Message>
         Space::with_height(10),
     ];
 
-    let filtered_files: Vec<&EvidenceFile> = state.evidence_files
+    let mut filtered_files = state.evidence_files
         .iter()
         .filter(|f| f.file_type == media_type)
-        .collect();
+        .peekable();
 
-    if filtered_files.is_empty() {
+    if filtered_files.peek().is_none() {
         content = content.push(
             text(format!("No {} files found", type_label.to_lowercase()))
-                .style(theme::Text::Color(Color::from_rgb(0.5, 0.5, 0.5)))
+                .style(theme::Text::Color(MUTED))
         );
     } else {
-        let mut file_list = Column::new().spacing(2);
-        for file in filtered_files {
-            let icon = match file.file_type {
-                EvidenceType::Image => "🖼",
-                EvidenceType::Audio => "🎵",
-                EvidenceType::Video => "🎬",
-                EvidenceType::Document => "📄",
-                EvidenceType::Quote => "💬",
-            };
-            
-            file_list = file_list.push(
+        let file_list = Column::with_children(
+            filtered_files.map(|file| {
+                let icon = match file.file_type {
+                    EvidenceType::Image => "🖼",
+                    EvidenceType::Audio => "🎵",
+                    EvidenceType::Video => "🎬",
+                    EvidenceType::Document => "📄",
+                    EvidenceType::Quote => "💬",
+                };
+
                 row![
                     text(icon),
                     text(&file.original_name)
                         .width(Length::Fill),
                     text(format!("{} KB", file.size / 1024))
-                        .style(theme::Text::Color(Color::from_rgb(0.5, 0.5, 0.5))),
+                        .style(theme::Text::Color(MUTED)),
                 ]
                 .spacing(5)
                 .align_items(Alignment::Center)
-            );
-        }
-        
+                .into()
+            })
+        )
+        .spacing(2);
+
+
         content = content.push(
             scrollable(file_list)
                 .height(Length::Fixed(400.0))
@@ -403,18 +417,17 @@ fn quotes_tab<'a>(state: &'a AppState, person: &'a Person) -> Element<'a, Messag
     if person.quotes.is_empty() {
         content = content.push(
             text("No quotes added yet")
-                .style(theme::Text::Color(Color::from_rgb(0.5, 0.5, 0.5)))
+                .style(theme::Text::Color(MUTED))
         );
     } else {
         content = content.push(
             text("Quotes")
                 .size(14)
-                .style(theme::Text::Color(Color::from_rgb(0.2, 0.2, 0.8)))
+                .style(theme::Text::Color(ACCENT))
         );
 
-        let mut quote_list = Column::new().spacing(2);
-        for quote in &person.quotes {
-            quote_list = quote_list.push(
+        let quote_list = Column::with_children(
+            person.quotes.iter().map(|quote| {
                 row![
                     text(&quote.quote)
                         .width(Length::FillPortion(2)),
@@ -430,9 +443,12 @@ fn quotes_tab<'a>(state: &'a AppState, person: &'a Person) -> Element<'a, Messag
                 ]
                 .spacing(5)
                 .align_items(Alignment::Center)
-            );
-        }
-        
+                .into()
+            })
+        )
+        .spacing(2);
+
+
         content = content.push(
             scrollable(quote_list)
                 .height(Length::Fixed(300.0))
@@ -446,33 +462,27 @@ fn quotes_tab<'a>(state: &'a AppState, person: &'a Person) -> Element<'a, Messag
 }
 
 // Modal dialogs
-pub fn add_person_dialog(state: &AppState) -> Option<Element<'_, Message>> {
-    if !state.show_add_person_dialog {
-        return None;
-    }
-
-    Some(
-        container(
-            column![
-                text("Add Person").size(18),
-                Space::with_height(10),
-                text_input("Name", &state.new_person_name)
-                    .on_input(Message::AddPersonNameChanged),
-                Space::with_height(10),
-                row![
-                    button("Cancel")
-                        .on_press(Message::ShowAddPersonDialog(false)),
-                    Space::with_width(Length::Fill),
-                    button("Add")
-                        .on_press(Message::AddPersonSubmitted)
-                        .style(theme::Button::Primary),
-                ]
-                .spacing(10),
+pub fn add_person_dialog(state: &AppState) -> Element<'_, Message> {
+    container(
+        column![
+            text("Add Person").size(18),
+            Space::with_height(10),
+            text_input("Name", &state.new_person_name)
+                .on_input(Message::AddPersonNameChanged),
+            Space::with_height(10),
+            row![
+                button("Cancel")
+                    .on_press(Message::ShowAddPersonDialog(false)),
+                Space::with_width(Length::Fill),
+                button("Add")
+                    .on_press(Message::AddPersonSubmitted)
+                    .style(theme::Button::Primary),
             ]
-            .spacing(5)
-        )
-        .padding(20)
-        .style(theme::Container::Box)
-        .into()
+            .spacing(10),
+        ]
+        .spacing(5)
     )
+    .padding(20)
+    .style(theme::Container::Box)
+    .into()
 }
\ No newline at end of file
@@ -9,8 +9,11 @@ pub struct Person {
     pub name: String,
     pub created_at: DateTime<Utc>,
     pub updated_at: DateTime<Utc>,
+    #[serde(default)]
     pub notes: String,
+    #[serde(default)]
     pub tags: Vec<String>,
+    #[serde(default)]
     pub information: Vec<PersonInfo>,
     #[serde(default)] // Backward compatibility
     pub quotes: Vec<Quote>,
@@ -117,13 +120,25 @@ pub enum EvidenceType {
 
 impl EvidenceType {
     pub fn from_extension(ext: &str) -> Option<Self> {
-        let ext = ext.to_lowercase();
-        match ext.as_str() {
-            "jpg" | "jpeg" | "png" | "gif" | "bmp" | "tiff" | "webp" => Some(EvidenceType::Image),
-            "mp3" | "wav" | "flac" | "aac" | "ogg" | "m4a" => Some(EvidenceType::Audio),
-            "mp4" | "avi" | "mov" | "wmv" | "flv" | "webm" | "mkv" => Some(EvidenceType::Video),
-            "pdf" | "doc" | "docx" | "txt" | "rtf" => Some(EvidenceType::Document),
-            _ => None,
+        const IMAGE_EXTS: &[&str] = &["jpg", "jpeg", "png", "gif", "bmp", "tiff", "webp"];
+        const AUDIO_EXTS: &[&str] = &["mp3", "wav", "flac", "aac", "ogg", "m4a"];
+        const VIDEO_EXTS: &[&str] = &["mp4", "avi", "mov", "wmv", "flv", "webm", "mkv"];
+        const DOCUMENT_EXTS: &[&str] = &["pdf", "doc", "docx", "txt", "rtf"];
+
+        // Compare case-insensitively in place instead of allocating a
+        // lowercased copy for every lookup
+        let matches = |exts: &[&str]| exts.iter().any(|e| ext.eq_ignore_ascii_case(e));
+
+        if matches(IMAGE_EXTS) {
+            Some(EvidenceType::Image)
+        } else if matches(AUDIO_EXTS) {
+            Some(EvidenceType::Audio)
+        } else if matches(VIDEO_EXTS) {
+            Some(EvidenceType::Video)
+        } else if matches(DOCUMENT_EXTS) {
+            Some(EvidenceType::Document)
+        } else {
+            None
         }
     }
 
@@ -5,6 +5,7 @@ use crate::gui::EvidenceTab;
 use iced::{
     Application, Command, Element, Theme, executor, Subscription,
 };
+use std::collections::HashMap;
 use std::path::PathBuf;
 use uuid::Uuid;
 use anyhow::Result;
@@ -38,7 +39,7 @@ pub enum Message {
     // File operations
     SelectFileClicked,
     FileSelected(PathBuf),
-    FileAddedSuccessfully,
+    FileAddedSuccessfully(Uuid),
     ImportClicked,
     ExportClicked,
     ExportPersonClicked,
@@ -47,14 +48,15 @@ pub enum Message {
     ExportPersonFileSelected(PathBuf),
     
     // Async operations
+    PersonsLoaded(Result<Vec<Person>, String>),
     ImportComplete(Result<Vec<Person>, String>),
     ExportComplete(Result<(), String>),
     PersonAdded(Result<Person, String>),
-    PersonDeleted(Result<(), String>),
-    InfoAdded(Result<(), String>),
-    InfoRemoved(Result<(), String>),
-    QuoteAdded(Result<(), String>),
-    QuoteRemoved(Result<(), String>),
+    PersonDeleted(Result<Uuid, String>),
+    InfoAdded(Result<Person, String>),
+    InfoRemoved(Result<Person, String>),
+    QuoteAdded(Result<Person, String>),
+    QuoteRemoved(Result<Person, String>),
     
     // UI state
     SearchQueryChanged(String),
@@ -75,6 +77,7 @@ pub struct AppState {
     pub persons: Vec<Person>,
     pub selected_person: Option<Uuid>,
     pub evidence_files: Vec<EvidenceFile>,
+    evidence_cache: HashMap<Uuid, Vec<EvidenceFile>>,
     
     // UI State
     pub current_tab: EvidenceTab,
@@ -104,14 +107,14 @@ impl AppState {
     pub fn new() -> Result<Self> {
         let file_manager = FileManager::new()?;
         let export_import_manager = ExportImportManager::new(file_manager.clone());
-        let persons = file_manager.load_all_persons().unwrap_or_default();
-        
+
         Ok(Self {
             file_manager,
             export_import_manager,
-            persons,
+            persons: Vec::new(),
             selected_person: None,
             evidence_files: Vec::new(),
+            evidence_cache: HashMap::new(),
             current_tab: EvidenceTab::Information,
             search_query: String::new(),
             filtered_persons: Vec::new(),
@@ -134,9 +137,10 @@ impl AppState {
         if self.search_query.is_empty() {
             self.filtered_persons = self.persons.iter().map(|p| p.id).collect();
         } else {
+            let query = self.search_query.to_lowercase();
             self.filtered_persons = self.persons
                 .iter()
-                .filter(|p| p.name.to_lowercase().contains(&self.search_query.to_lowercase()))
+                .filter(|p| p.name.to_lowercase().contains(&query))
                 .map(|p| p.id)
                 .collect();
         }
@@ -146,15 +150,28 @@ impl AppState {
         self.status_message = message;
         self.status_timeout = 5.0;
     }
-    
-    
+
+    pub fn current_person(&self) -> Option<&Person> {
+        self.selected_person
+            .and_then(|id| self.persons.iter().find(|p| p.id == id))
+    }
+
     pub fn refresh_evidence_files(&mut self) {
         if let Some(person_id) = self.selected_person {
-            if let Some(person) = self.persons.iter().find(|p| p.id == person_id) {
+            if let Some(files) = self.evidence_cache.get(&person_id) {
+                // Nothing changed this person's evidence since the last
+                // scan, so reuse it instead of re-walking the folder
+                self.evidence_files = files.clone();
+            } else if let Some(person) = self.persons.iter().find(|p| p.id == person_id) {
                 match self.file_manager.scan_person_evidence(person) {
-                    Ok(files) => self.evidence_files = files,
+                    Ok(files) => {
+                        self.evidence_files = files.clone();
+                        self.evidence_cache.insert(person_id, files);
+                    }
                     Err(_) => self.evidence_files.clear(),
                 }
+            } else {
+                self.evidence_files.clear();
             }
         } else {
             self.evidence_files.clear();
@@ -172,7 +189,14 @@ impl Application for AppState {
         match Self::new() {
             Ok(mut state) => {
                 state.update_filtered_persons();
-                (state, Command::none())
+                let file_manager = state.file_manager.clone();
+                let load_persons = Command::perform(
+                    async move {
+                        file_manager.load_all_persons().map_err(|e| e.to_string())
+                    },
+                    Message::PersonsLoaded
+                );
+                (state, load_persons)
             }
             Err(e) => {
                 eprintln!("Failed to initialize application: {}", e);
@@ -188,8 +212,12 @@ impl Application for AppState {
     fn update(&mut self, message: Message) -> Command<Message> {
         match message {
             Message::PersonSelected(id) => {
-                self.selected_person = Some(id);
-                self.refresh_evidence_files();
+                // Re-clicking the selected person would only repeat the
+                // evidence scan
+                if self.selected_person != Some(id) {
+                    self.selected_person = Some(id);
+                    self.refresh_evidence_files();
+                }
                 Command::none()
             }
             
@@ -244,7 +272,9 @@ impl Application for AppState {
                     
                     Command::perform(
                         async move {
-                            file_manager.delete_person(&person_clone).map_err(|e| e.to_string())
+                            file_manager.delete_person(&person_clone)
+                                .map(|_| person_clone.id)
+                                .map_err(|e| e.to_string())
                         },
                         Message::PersonDeleted
                     )
@@ -255,18 +285,15 @@ impl Application for AppState {
             
             Message::PersonDeleted(result) => {
                 match result {
-                    Ok(()) => {
-                        if let Some(id) = self.selected_person {
-                            // Store the person ID before removing
-                            let person_id_to_remove = id;
-                            self.persons.retain(|p| p.id != person_id_to_remove);
-                            if self.selected_person == Some(person_id_to_remove) {
-                                self.selected_person = None;
-                                self.evidence_files.clear();
-                            }
-                            self.update_filtered_persons();
-                            self.update_status("Person successfully deleted".to_string());
+                    Ok(deleted_id) => {
+                        self.persons.retain(|p| p.id != deleted_id);
+                        self.evidence_cache.remove(&deleted_id);
+                        if self.selected_person == Some(deleted_id) {
+                            self.selected_person = None;
+                            self.evidence_files.clear();
                         }
+                        self.update_filtered_persons();
+                        self.update_status("Person successfully deleted".to_string());
                     }
                     Err(e) => {
                         self.update_status(format!("Failed to delete person: {}", e));
@@ -287,27 +314,23 @@ impl Application for AppState {
             
             Message::AddInfoSubmitted => {
                 if !self.new_info_type.trim().is_empty() && !self.new_info_value.trim().is_empty() {
-                    if let Some(person_id) = self.selected_person {
-                        if let Some(person) = self.persons.iter().find(|p| p.id == person_id) {
-                            let person_clone = person.clone();
-                            let info_type = self.new_info_type.trim().to_string();
-                            let info_value = self.new_info_value.trim().to_string();
-                            let file_manager = self.file_manager.clone();
-                            
-                            self.new_info_type.clear();
-                            self.new_info_value.clear();
-                            
-                            Command::perform(
-                                async move {
-                                    let mut person = person_clone;
-                                    person.add_information(info_type, info_value);
-                                    file_manager.save_person_data(&person).map_err(|e| e.to_string())
-                                },
-                                Message::InfoAdded
-                            )
-                        } else {
-                            Command::none()
-                        }
+                    if let Some(person) = self.current_person() {
+                        let person_clone = person.clone();
+                        let info_type = self.new_info_type.trim().to_string();
+                        let info_value = self.new_info_value.trim().to_string();
+                        let file_manager = self.file_manager.clone();
+
+                        self.new_info_type.clear();
+                        self.new_info_value.clear();
+
+                        Command::perform(
+                            async move {
+                                let mut person = person_clone;
+                                person.add_information(info_type, info_value);
+                                file_manager.save_person_data(&person).map(|_| person).map_err(|e| e.to_string())
+                            },
+                            Message::InfoAdded
+                        )
                     } else {
                         Command::none()
                     }
@@ -318,18 +341,12 @@ impl Application for AppState {
             
             Message::InfoAdded(result) => {
                 match result {
-                    Ok(()) => {
+                    Ok(updated_person) => {
                         self.update_status("Information successfully added".to_string());
-                        // Refresh the person data
-                        if let Some(person_id) = self.selected_person {
-                            if let Some(person) = self.persons.iter_mut().find(|p| p.id == person_id) {
-                                // Reload person data to get updated information
-                                if let Ok(updated_person) = self.file_manager.load_person_data(
-                                    &self.file_manager.get_evidence_dir().join(person.folder_name())
-                                ) {
-                                    *person = updated_person;
-                                }
-                            }
+                        // The save already worked on the updated person;
+                        // patch it in memory instead of re-reading the file
+                        if let Some(person) = self.persons.iter_mut().find(|p| p.id == updated_person.id) {
+                            *person = updated_person;
                         }
                     }
                     Err(e) => {
@@ -340,22 +357,18 @@ impl Application for AppState {
             }
             
             Message::RemoveInfo(info_id) => {
-                if let Some(person_id) = self.selected_person {
-                    if let Some(person) = self.persons.iter().find(|p| p.id == person_id) {
-                        let person_clone = person.clone();
-                        let file_manager = self.file_manager.clone();
-                        
-                        Command::perform(
-                            async move {
-                                let mut person = person_clone;
-                                person.remove_information(info_id);
-                                file_manager.save_person_data(&person).map_err(|e| e.to_string())
-                            },
-                            Message::InfoRemoved
-                        )
-                    } else {
-                        Command::none()
-                    }
+                if let Some(person) = self.current_person() {
+                    let person_clone = person.clone();
+                    let file_manager = self.file_manager.clone();
+
+                    Command::perform(
+                        async move {
+                            let mut person = person_clone;
+                            person.remove_information(info_id);
+                            file_manager.save_person_data(&person).map(|_| person).map_err(|e| e.to_string())
+                        },
+                        Message::InfoRemoved
+                    )
                 } else {
                     Command::none()
                 }
@@ -363,17 +376,12 @@ impl Application for AppState {
             
             Message::InfoRemoved(result) => {
                 match result {
-                    Ok(()) => {
+                    Ok(updated_person) => {
                         self.update_status("Information successfully removed".to_string());
-                        // Refresh the person data
-                        if let Some(person_id) = self.selected_person {
-                            if let Some(person) = self.persons.iter_mut().find(|p| p.id == person_id) {
-                                if let Ok(updated_person) = self.file_manager.load_person_data(
-                                    &self.file_manager.get_evidence_dir().join(person.folder_name())
-                                ) {
-                                    *person = updated_person;
-                                }
-                            }
+                        // The save already worked on the updated person;
+                        // patch it in memory instead of re-reading the file
+                        if let Some(person) = self.persons.iter_mut().find(|p| p.id == updated_person.id) {
+                            *person = updated_person;
                         }
                     }
                     Err(e) => {
@@ -405,39 +413,35 @@ impl Application for AppState {
             
             Message::AddQuoteSubmitted => {
                 if !self.new_quote_text.trim().is_empty() && !self.new_quote_date.trim().is_empty() {
-                    if let Some(person_id) = self.selected_person {
-                        if let Some(person) = self.persons.iter().find(|p| p.id == person_id) {
-                            let person_clone = person.clone();
-                            let quote_text = self.new_quote_text.trim().to_string();
-                            let quote_date = self.new_quote_date.trim().to_string();
-                            let quote_time = if self.new_quote_time.trim().is_empty() {
-                                None
-                            } else {
-                                Some(self.new_quote_time.trim().to_string())
-                            };
-                            let quote_place = if self.new_quote_place.trim().is_empty() {
-                                None
-                            } else {
-                                Some(self.new_quote_place.trim().to_string())
-                            };
-                            let file_manager = self.file_manager.clone();
-                            
-                            self.new_quote_text.clear();
-                            self.new_quote_date.clear();
-                            self.new_quote_time.clear();
-                            self.new_quote_place.clear();
-                            
-                            Command::perform(
-                                async move {
-                                    let mut person = person_clone;
-                                    person.add_quote(quote_text, quote_date, quote_time, quote_place);
-                                    file_manager.save_person_data(&person).map_err(|e| e.to_string())
-                                },
-                                Message::QuoteAdded
-                            )
+                    if let Some(person) = self.current_person() {
+                        let person_clone = person.clone();
+                        let quote_text = self.new_quote_text.trim().to_string();
+                        let quote_date = self.new_quote_date.trim().to_string();
+                        let quote_time = if self.new_quote_time.trim().is_empty() {
+                            None
                         } else {
-                            Command::none()
-                        }
+                            Some(self.new_quote_time.trim().to_string())
+                        };
+                        let quote_place = if self.new_quote_place.trim().is_empty() {
+                            None
+                        } else {
+                            Some(self.new_quote_place.trim().to_string())
+                        };
+                        let file_manager = self.file_manager.clone();
+
+                        self.new_quote_text.clear();
+                        self.new_quote_date.clear();
+                        self.new_quote_time.clear();
+                        self.new_quote_place.clear();
+
+                        Command::perform(
+                            async move {
+                                let mut person = person_clone;
+                                person.add_quote(quote_text, quote_date, quote_time, quote_place);
+                                file_manager.save_person_data(&person).map(|_| person).map_err(|e| e.to_string())
+                            },
+                            Message::QuoteAdded
+                        )
                     } else {
                         Command::none()
                     }
@@ -448,17 +452,12 @@ impl Application for AppState {
             
             Message::QuoteAdded(result) => {
                 match result {
-                    Ok(()) => {
+                    Ok(updated_person) => {
                         self.update_status("Quote successfully added".to_string());
-                        // Refresh the person data
-                        if let Some(person_id) = self.selected_person {
-                            if let Some(person) = self.persons.iter_mut().find(|p| p.id == person_id) {
-                                if let Ok(updated_person) = self.file_manager.load_person_data(
-                                    &self.file_manager.get_evidence_dir().join(person.folder_name())
-                                ) {
-                                    *person = updated_person;
-                                }
-                            }
+                        // The save already worked on the updated person;
+                        // patch it in memory instead of re-reading the file
+                        if let Some(person) = self.persons.iter_mut().find(|p| p.id == updated_person.id) {
+                            *person = updated_person;
                         }
                     }
                     Err(e) => {
@@ -469,22 +468,18 @@ impl Application for AppState {
             }
             
             Message::RemoveQuote(quote_id) => {
-                if let Some(person_id) = self.selected_person {
-                    if let Some(person) = self.persons.iter().find(|p| p.id == person_id) {
-                        let person_clone = person.clone();
-                        let file_manager = self.file_manager.clone();
-                        
-                        Command::perform(
-                            async move {
-                                let mut person = person_clone;
-                                person.remove_quote(quote_id);
-                                file_manager.save_person_data(&person).map_err(|e| e.to_string())
-                            },
-                            Message::QuoteRemoved
-                        )
-                    } else {
-                        Command::none()
-                    }
+                if let Some(person) = self.current_person() {
+                    let person_clone = person.clone();
+                    let file_manager = self.file_manager.clone();
+
+                    Command::perform(
+                        async move {
+                            let mut person = person_clone;
+                            person.remove_quote(quote_id);
+                            file_manager.save_person_data(&person).map(|_| person).map_err(|e| e.to_string())
+                        },
+                        Message::QuoteRemoved
+                    )
                 } else {
                     Command::none()
                 }
@@ -492,17 +487,12 @@ impl Application for AppState {
             
             Message::QuoteRemoved(result) => {
                 match result {
-                    Ok(()) => {
+                    Ok(updated_person) => {
                         self.update_status("Quote successfully removed".to_string());
-                        // Refresh the person data
-                        if let Some(person_id) = self.selected_person {
-                            if let Some(person) = self.persons.iter_mut().find(|p| p.id == person_id) {
-                                if let Ok(updated_person) = self.file_manager.load_person_data(
-                                    &self.file_manager.get_evidence_dir().join(person.folder_name())
-                                ) {
-                                    *person = updated_person;
-                                }
-                            }
+                        // The save already worked on the updated person;
+                        // patch it in memory instead of re-reading the file
+                        if let Some(person) = self.persons.iter_mut().find(|p| p.id == updated_person.id) {
+                            *person = updated_person;
                         }
                     }
                     Err(e) => {
@@ -546,43 +536,44 @@ impl Application for AppState {
             }
             
             Message::FileSelected(path) => {
-                if let Some(person_id) = self.selected_person {
-                    if let Some(person) = self.persons.iter().find(|p| p.id == person_id) {
-                        let person_clone = person.clone();
-                        let file_manager = self.file_manager.clone();
-                        
-                        Command::perform(
-                            async move {
-                                if let Some(extension) = path.extension() {
-                                    let ext_str = extension.to_string_lossy();
-                                    
-                                    if let Some(evidence_type) = EvidenceType::from_extension(&ext_str) {
-                                        file_manager.copy_file_to_evidence(&person_clone, &path, evidence_type).map_err(|e| e.to_string())
-                                    } else {
-                                        Err(format!("Unsupported file type: {}", ext_str))
-                                    }
+                if let Some(person) = self.current_person() {
+                    let person_clone = person.clone();
+                    let file_manager = self.file_manager.clone();
+
+                    Command::perform(
+                        async move {
+                            if let Some(extension) = path.extension() {
+                                let ext_str = extension.to_string_lossy();
+
+                                if let Some(evidence_type) = EvidenceType::from_extension(&ext_str) {
+                                    file_manager.copy_file_to_evidence(&person_clone, &path, evidence_type).map_err(|e| e.to_string())
                                 } else {
-                                    Err("File has no extension".to_string())
-                                }
-                            },
-                            |result| {
-                                match result {
-                                    Ok(_) => Message::FileAddedSuccessfully,
-                                    Err(e) => Message::StatusMessage(format!("Failed to add file: {}", e)),
+                                    Err(format!("Unsupported file type: {}", ext_str))
                                 }
+                            } else {
+                                Err("File has no extension".to_string())
                             }
-                        )
-                    } else {
-                        Command::none()
-                    }
+                        },
+                        |result| {
+                            match result {
+                                Ok(file) => Message::FileAddedSuccessfully(file.person_id),
+                                Err(e) => Message::StatusMessage(format!("Failed to add file: {}", e)),
+                            }
+                        }
+                    )
                 } else {
                     Command::none()
                 }
             }
             
-            Message::FileAddedSuccessfully => {
+            Message::FileAddedSuccessfully(person_id) => {
                 self.update_status("File successfully added".to_string());
-                self.refresh_evidence_files();
+                // Evict the person the copy actually targeted; the selection
+                // may have moved on while the copy ran
+                self.evidence_cache.remove(&person_id);
+                if self.selected_person == Some(person_id) {
+                    self.refresh_evidence_files();
+                }
                 Command::none()
             }
             
@@ -622,27 +613,23 @@ impl Application for AppState {
             }
             
             Message::ExportPersonClicked => {
-                if let Some(person_id) = self.selected_person {
-                    if let Some(person) = self.persons.iter().find(|p| p.id == person_id) {
-                        let person_name = person.name.clone();
-                        Command::perform(
-                            async move {
-                                rfd::FileDialog::new()
-                                    .add_filter("Evidence Manager Archive", &["ema"])
-                                    .set_file_name(format!("{}.ema", person_name.replace(" ", "_")))
-                                    .save_file()
-                            },
-                            |path| {
-                                if let Some(path) = path {
-                                    Message::ExportPersonFileSelected(path)
-                                } else {
-                                    Message::StatusMessage("Export cancelled".to_string())
-                                }
+                if let Some(person) = self.current_person() {
+                    let person_name = person.name.clone();
+                    Command::perform(
+                        async move {
+                            rfd::FileDialog::new()
+                                .add_filter("Evidence Manager Archive", &["ema"])
+                                .set_file_name(format!("{}.ema", person_name.replace(" ", "_")))
+                                .save_file()
+                        },
+                        |path| {
+                            if let Some(path) = path {
+                                Message::ExportPersonFileSelected(path)
+                            } else {
+                                Message::StatusMessage("Export cancelled".to_string())
                             }
-                        )
-                    } else {
-                        Command::none()
-                    }
+                        }
+                    )
                 } else {
                     Command::perform(
                         async { Message::StatusMessage("No person selected for export".to_string()) },
@@ -677,30 +664,42 @@ impl Application for AppState {
             }
             
             Message::ExportPersonFileSelected(path) => {
-                if let Some(person_id) = self.selected_person {
-                    if let Some(person) = self.persons.iter().find(|p| p.id == person_id) {
-                        let export_import_manager = self.export_import_manager.clone();
-                        let person_clone = person.clone();
-                        
-                        Command::perform(
-                            async move {
-                                export_import_manager.export_to_ema(&path, &[person_clone], None).map_err(|e| e.to_string())
-                            },
-                            Message::ExportComplete
-                        )
-                    } else {
-                        Command::none()
-                    }
+                if let Some(person) = self.current_person() {
+                    let export_import_manager = self.export_import_manager.clone();
+                    let person_clone = person.clone();
+
+                    Command::perform(
+                        async move {
+                            export_import_manager.export_to_ema(&path, &[person_clone], None).map_err(|e| e.to_string())
+                        },
+                        Message::ExportComplete
+                    )
                 } else {
                     Command::none()
                 }
             }
             
+            Message::PersonsLoaded(result) => {
+                match result {
+                    Ok(persons) => {
+                        self.persons = persons;
+                        self.update_filtered_persons();
+                    }
+                    Err(e) => {
+                        self.update_status(format!("Failed to load persons: {}", e));
+                    }
+                }
+                Command::none()
+            }
+
             Message::ImportComplete(result) => {
                 match result {
                     Ok(imported_persons) => {
                         self.persons.extend(imported_persons);
                         self.persons.sort_by(|a, b| a.name.cmp(&b.name));
+                        // An import can add files to existing persons too,
+                        // so every cached scan is suspect
+                        self.evidence_cache.clear();
                         self.update_filtered_persons();
                         self.update_status(".ema successfully imported".to_string());
                     }